@@ -49,7 +49,7 @@ def from_dict(obj_dict: dict, obj_type: str = None) -> DSpaceObject | Item | Com
                        obj_dict['name'] if 'name' in obj_dict.keys() else '')
             if 'collection' in obj_dict.keys():
                 obj.collections = [Collection(obj_dict['collection'])]
-            relationships = filter(lambda x: re.search(r'^relation.', x), obj_dict.keys())
+            relationships = [k for k in obj_dict.keys() if re.search(r'^relation.', k)]
             for r in relationships:
                 obj.add_relation(r.split('.')[1], obj_dict[r])
 
@@ -68,8 +68,7 @@ def from_dict(obj_dict: dict, obj_type: str = None) -> DSpaceObject | Item | Com
         case _:
             raise TypeError('The obj_type parameter must be one of (item, collection, community or None)'
                             f'but got {obj_type}')
-    for key in filter(lambda x: re.search(r'[a-zA-Z0-9\-]\.[a-zA-Z0-9\-](\.[a-zA-Z0-9\-])?', x),
-                      obj_dict.keys()):
+    for key in [k for k in obj_dict.keys() if re.search(r'[a-zA-Z0-9\-]\.[a-zA-Z0-9\-](\.[a-zA-Z0-9\-])?', k)]:
         if not isinstance(obj_dict[key], list) and not isinstance(obj_dict[key], dict):
             obj.add_metadata(tag=key, value=obj_dict[key])
         elif isinstance(obj_dict[key], list):
@@ -1,6 +1,16 @@
+import asyncio
+import os
+import tempfile
+import time
 import unittest
+from unittest import mock
+from io import BytesIO
+
+import requests
+from PIL import Image
+
 from dspyce.bitstreams.models import Bundle
-from dspyce.bitstreams.models import Bitstream
+from dspyce.bitstreams.models import Bitstream, IIIFBitstream
 
 
 class BitstreamsTest(unittest.TestCase):
@@ -10,6 +20,12 @@ class BitstreamsTest(unittest.TestCase):
     def test_init_bundle(self):
         self.assertIsInstance(self.bundle, Bundle)
         self.assertEqual(Bundle.DEFAULT_BUNDLE, self.bundle.name)
+        bitstreams = [Bitstream('file1.txt', '/test'), Bitstream('file2.txt', '/test')]
+        bundle = Bundle(bitstreams=bitstreams)
+        self.assertListEqual(bitstreams, bundle.get_bitstreams())
+        self.assertIsNot(bundle.bitstreams, bundle.get_bitstreams())
+        self.assertListEqual([bitstreams[1]], bundle.get_bitstreams(lambda b: b.file_name == 'file2.txt'))
+        self.assertTrue(all(b.bundle is bundle for b in bundle.bitstreams))
 
     def test_init_bitstream(self):
         self.assertIsInstance(self.bitstream, Bitstream)
@@ -21,6 +37,114 @@ class BitstreamsTest(unittest.TestCase):
         self.bundle.remove_bitstream(self.bitstream)
         self.assertNotIn(self.bitstream, self.bundle.get_bitstreams())
 
+    def test_hash(self):
+        bitstream = Bitstream('file.txt', '/test', uuid='123')
+        self.assertEqual(hash(bitstream), hash(Bitstream('file.txt', '/test')))
+        self.assertEqual(2, len({bitstream, Bitstream('file.txt', '/test', uuid='123'),
+                                 Bitstream('file2.txt', '/test')}))
+
+    def test_full_path(self):
+        bitstream = Bitstream('file.txt', '/test/path')
+        self.assertEqual('/test/path/file.txt', bitstream.full_path)
+        bitstream.add_metadata('dc.title', 'other.txt')
+        self.assertEqual('/test/path/other.txt', bitstream.full_path)
+        bitstream.path = '/other/path/'
+        self.assertEqual('/other/path/other.txt', bitstream.full_path)
+
+    def test_save_bitstream(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as target:
+            with open(os.path.join(src, 'file.txt'), 'wb') as f:
+                f.write(b'Hello World')
+            bitstream = Bitstream('file.txt', src)
+            bitstream.save_bitstream(target)
+            with open(os.path.join(target, 'file.txt'), 'rb') as f:
+                self.assertEqual(b'Hello World', f.read())
+            self.assertEqual(b'Hello World', bitstream.get_bitstream_file())
+            with bitstream.open_bitstream() as f:
+                self.assertEqual(b'Hello World', f.read())
+            bitstream.set_size()
+            self.assertEqual(11, bitstream.size_bytes)
+            self.assertRaises(FileExistsError, bitstream.save_bitstream, target)
+            self.assertEqual('b10a8db164e0754105b7a99be72e3fe5', bitstream.compute_checksum())
+            self.assertEqual('b10a8db164e0754105b7a99be72e3fe5', bitstream.check_sum)
+            self.assertEqual('a591a6d40bf420404a011733cfb7b190d62c65bf0bcda32b57b277d9ad9f146e',
+                             bitstream.compute_checksum('sha256'))
+
+    def test_save_bitstream_copy_fallback(self):
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as target:
+            with open(os.path.join(src, 'file.txt'), 'wb') as f:
+                f.write(b'Hello World')
+            with mock.patch('os.copy_file_range', return_value=0, create=True):
+                Bitstream('file.txt', src).save_bitstream(target)
+            with open(os.path.join(target, 'file.txt'), 'rb') as f:
+                self.assertEqual(b'Hello World', f.read())
+
+    def _check_save_bitstreams(self, save):
+        """
+        Saves a bundle of five local bitstreams twice with the given save function and checks the result.
+
+        :param save: A function saving the given bundle into the given path.
+        """
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as target:
+            bundle = Bundle()
+            for i in range(5):
+                with open(os.path.join(src, f'file{i}.txt'), 'w') as f:
+                    f.write(f'File {i}')
+                bundle.add_bitstream(Bitstream(f'file{i}.txt', src))
+            save(bundle, target)
+            self.assertListEqual(sorted(f'file{i}.txt' for i in range(5)), sorted(os.listdir(target)))
+            self.assertRaises(FileExistsError, save, bundle, target)
+
+    def test_save_bitstreams(self):
+        self._check_save_bitstreams(lambda bundle, target: bundle.save_bitstreams(target, max_workers=2))
+
+    def test_save_bitstreams_async(self):
+        self._check_save_bitstreams(
+            lambda bundle, target: asyncio.run(bundle.save_bitstreams_async(target, concurrency=2)))
+
+    def test_save_bitstreams_async_failure(self):
+        class SlowBitstream(Bitstream):
+            def save_bitstream(self, path: str, timeout: int = 30):
+                time.sleep(0.2)
+                super().save_bitstream(path, timeout)
+
+        with tempfile.TemporaryDirectory() as src, tempfile.TemporaryDirectory() as target:
+            for name in ('slow.txt', 'existing.txt'):
+                with open(os.path.join(src, name), 'w') as f:
+                    f.write(name)
+            with open(os.path.join(target, 'existing.txt'), 'w') as f:
+                f.write('existing')
+            bundle = Bundle(bitstreams=[SlowBitstream('slow.txt', src), Bitstream('existing.txt', src)])
+            self.assertRaises(FileExistsError, asyncio.run, bundle.save_bitstreams_async(target, concurrency=2))
+            with open(os.path.join(target, 'slow.txt')) as f:
+                self.assertEqual('slow.txt', f.read())
+
+    def test_set_size_remote(self):
+        session = mock.MagicMock()
+        session.head.return_value.headers = {'Content-Length': '4321'}
+        bitstream = Bitstream('file.txt', 'https://example.org/file.txt')
+        with mock.patch('dspyce.bitstreams.models._get_session', return_value=session):
+            bitstream.set_size()
+            self.assertEqual(4321, bitstream.size_bytes)
+            session.head.return_value.headers = {}
+            session.get.return_value.__enter__.return_value.headers = {'Content-Range': 'bytes 0-0/1234'}
+            bitstream.set_size()
+            self.assertEqual(1234, bitstream.size_bytes)
+            self.assertEqual({'Range': 'bytes=0-0'}, session.get.call_args.kwargs['headers'])
+            session.get.return_value.__enter__.return_value.headers = {'Content-Range': 'bytes 0-0/*'}
+            self.assertRaises(requests.exceptions.InvalidHeader, bitstream.set_size)
+
+    def test_str(self):
+        bitstream = Bitstream('file.txt', '/test', Bundle('THUMBNAIL'), primary=True)
+        self.assertEqual('file.txt\tbundle:THUMBNAIL\tprimary:true', str(bitstream))
+        bitstream.add_description('A file')
+        bitstream.add_permission('r', 'Anonymous')
+        bitstream.add_permission('w', 'Admin')
+        self.assertEqual('file.txt\tbundle:THUMBNAIL\tdescription:A file\tpermissions:-r \'Anonymous\''
+                         '\tpermissions:-w \'Admin\'\tprimary:true', str(bitstream))
+        bundle = Bundle('THUMBNAIL', uuid=None, bitstreams=[bitstream, Bitstream('other.txt', '/test')])
+        self.assertEqual(f'Bundle - THUMBNAIL:\n\t{bitstream}\n\tother.txt\tbundle:THUMBNAIL', str(bundle))
+
     def test_metadata(self):
         self.bitstream.add_metadata('dc.description', 'Hello World', 'en')
         self.assertEqual(self.bitstream.get_first_metadata_value('dc.description'), 'Hello World')
@@ -32,3 +156,33 @@ class BitstreamsTest(unittest.TestCase):
         self.assertEqual(self.bitstream.check_sum, 'md-123')
         self.assertTrue(self.bitstream.primary)
 
+    def test_iiif(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            Image.new('RGB', (200, 100)).save(os.path.join(tmp, 'image.png'))
+            bitstream = IIIFBitstream('image.png', tmp)
+            bitstream.add_iiif('Image', 'Chapter 1', w=50)
+            self.assertEqual('Image', bitstream.get_iiif_label())
+            self.assertEqual('Chapter 1', bitstream.get_iiif_toc())
+            self.assertEqual((50.0, 25.0), bitstream.get_bitstream_size())
+            self.assertEqual('image.png\tiiif-label:Image\tiiif-toc:Chapter 1\tiiif-width:50\tiiif-height:25',
+                             str(bitstream))
+            with Image.open(BytesIO(bitstream.get_bitstream_file())) as img:
+                self.assertEqual((50, 25), img.size)
+                self.assertEqual('PNG', img.format)
+            bitstream.set_size()
+            self.assertEqual(len(bitstream.get_bitstream_file()), bitstream.size_bytes)
+            os.mkdir(os.path.join(tmp, 'export'))
+            bitstream.save_bitstream(os.path.join(tmp, 'export'))
+            with Image.open(os.path.join(tmp, 'export', 'image.png')) as img:
+                self.assertEqual((50, 25), img.size)
+            Image.new('RGB', (300, 150)).save(os.path.join(tmp, 'image.jpg'))
+            bitstream = IIIFBitstream('image.jpg', tmp)
+            bitstream.add_iiif('Image', 'Chapter 2')
+            self.assertEqual((300.0, 150.0), bitstream.get_bitstream_size())
+            self.assertIsNone(bitstream.file)
+            bitstream = IIIFBitstream('image.jpg', tmp)
+            bitstream.add_iiif('Image', 'Chapter 2', w=100)
+            with Image.open(BytesIO(bitstream.get_bitstream_file())) as img:
+                self.assertEqual((100, 50), img.size)
+                self.assertEqual('JPEG', img.format)
+            self.assertEqual((100.0, 50.0), bitstream.get_bitstream_size())
@@ -40,6 +40,8 @@ class DSpaceObjectTest(unittest.TestCase):
         self.assertEqual(self.obj.get_metadata_values('relation.isAuthorOfPublication.latestForDiscovery')[0],
                          'kidll88-uuid999-duwkke1222')
         self.assertEqual(self.obj.get_first_metadata_value('dc.title'), 'hello')
+        self.assertListEqual(['hello'], list(self.obj.iter_metadata_values('dc.title')))
+        self.assertListEqual([], list(self.obj.iter_metadata_values('dc.title.alternative')))
         self.assertIsNone(self.obj.get_first_metadata('dc.title.alternative'))
         self.obj.add_metadata('dc.creator', MetaDataValue('Smith, Adam', 'en',
                                                           'orcid:123456', 2))
@@ -60,7 +62,20 @@ class DSpaceObjectTest(unittest.TestCase):
         self.assertEqual(['hello', 'hallo'], self.obj.get_metadata_values('dc.title'))
         self.obj.remove_metadata('dc.title', 'hallo')
         self.assertEqual(['hello'], self.obj.get_metadata_values('dc.title'))
+        self.obj.add_metadata('dc.title', 'salut', 'fr')
+        self.obj.add_metadata('dc.title', 'hello', 'en')
+        self.obj.remove_metadata('dc.title', 'hello')
+        self.assertEqual(['salut'], self.obj.get_metadata_values('dc.title'))
+        self.obj.add_metadata('dc.title', 'hallo', 'de')
+        self.obj.add_metadata('dc.title', 'hello', 'en')
+        self.obj.remove_metadata('dc.title', {'hallo', 'hello'})
+        self.assertEqual(['salut'], self.obj.get_metadata_values('dc.title'))
+        self.obj.remove_metadata('dc.title', index=1)
+        self.assertEqual(['salut'], self.obj.get_metadata_values('dc.title'))
         self.obj.remove_metadata('dc.title')
+        self.obj.remove_metadata('dc.title')
+        self.obj.remove_metadata('dc.title', 'hello')
+        self.assertFalse(self.obj.has_metadata('dc.title'))
 
     def test_replace_metadata(self):
         self.obj.add_metadata('dc.title', 'hello', 'en')
@@ -68,6 +83,23 @@ class DSpaceObjectTest(unittest.TestCase):
         self.obj.replace_metadata('dc.title', 'salut')
         self.assertEqual(['salut'], self.obj.get_metadata_values('dc.title'))
         self.obj.remove_metadata('dc.title')
+        self.obj.replace_metadata('dc.subject', 'x', 'en')
+        self.assertEqual(['x'], self.obj.get_metadata_values('dc.subject'))
+        self.assertEqual('en', self.obj.get_first_metadata('dc.subject').language)
+        self.obj.remove_metadata('dc.subject')
+
+    def test_remove_metadata_tracked(self):
+        """
+        Tests the delete operations tracked when removing a set of metadata values.
+        """
+        obj = Item('abc-uuid')
+        for v in ('a', 'b', 'c', 'd'):
+            obj.add_metadata('dc.title', v)
+        obj.track_updates()
+        obj.remove_metadata('dc.title', {'a', 'c'})
+        self.assertEqual(['b', 'd'], obj.get_metadata_values('dc.title'))
+        self.assertListEqual([0, 1], [u['position'] for u in obj._metadata_updates])
+        self.assertTrue(all(u['operation'] == 'delete' and u['tag'] == 'dc.title' for u in obj._metadata_updates))
 
     def test_move_metadata(self):
         self.obj.add_metadata('dc.title', 'hello', 'en')
@@ -109,6 +141,13 @@ class DSpaceObjectTest(unittest.TestCase):
         """
         self.assertTrue(self.obj == DSpaceObject('123445-123jljl1-234kjj'))
         self.assertFalse(self.obj == DSpaceObject('12dsf3445-234kjj'))
+        self.assertTrue(DSpaceObject(handle='doc/1') == DSpaceObject(handle='doc/1'))
+        self.assertRaises(ValueError, DSpaceObject.__eq__, DSpaceObject(), DSpaceObject())
+        self.assertEqual(hash(self.obj), hash(DSpaceObject('123445-123jljl1-234kjj')))
+        self.assertEqual(2, len({self.obj, DSpaceObject('123445-123jljl1-234kjj'), DSpaceObject(handle='doc/1')}))
+        with_uuid = Item('u1', 'h/1')
+        handle_only = Item('', 'h/1')
+        self.assertTrue(handle_only == with_uuid)
 
     def test_to_dict(self):
         """
@@ -152,6 +191,20 @@ class DSpaceObjectTest(unittest.TestCase):
         self.assertTrue(isinstance(self.obj.statistic_reports['TotalDownloads'], list))
         self.assertTrue(self.obj.has_statistics())
 
+    def test_shared_statistic_report(self):
+        """
+        Tests that a report added to several objects is not changed by adding further reports to one of them.
+        """
+        shared = {'TotalDownloads': [{'uuid': 'lkjlkjl', 'views': 12}]}
+        a = DSpaceObject('a-uuid')
+        b = DSpaceObject('b-uuid')
+        a.add_statistic_report(shared)
+        b.add_statistic_report(shared)
+        a.add_statistic_report({'TotalDownloads': {'uuid': '12345', 'views': 3}})
+        self.assertEqual(2, len(a.statistic_reports['TotalDownloads']))
+        self.assertEqual(1, len(b.statistic_reports['TotalDownloads']))
+        self.assertEqual(1, len(shared['TotalDownloads']))
+
     def test_rest(self):
         self.assertWarns(DeprecationWarning, ds.rest.object_to_json, self.obj)
         self.assertDictEqual(ds.rest.object_to_json(self.obj), {'handle': 'doc/12345', 'name': 'test-name',
@@ -1,7 +1,13 @@
+import os
+import tempfile
 import unittest
 
+from PIL import Image
+
 import dspyce as ds
 from dspyce.bitstreams.models import Bundle
+from dspyce.metadata import MetaDataValue
+from dspyce.metadata.models import MetaData
 
 
 class ItemTest(unittest.TestCase):
@@ -22,6 +28,16 @@ class ItemTest(unittest.TestCase):
         self.item.add_relation('isAuthorOfPublication', 'xyz-uuid')
         self.assertRaises(TypeError, ds.Item('').add_relation, 'isContributionOfPublication', 'xyz-uuid')
         self.assertEqual(ds.Item(uuid='xyz-uuid'), self.item.get_related()[0])
+        item = ds.Item('abc')
+        self.assertFalse(item.is_entity())
+        item.enable_entity('Person')
+        self.assertTrue(item.is_entity())
+        item.remove_metadata('dspace.entity.type')
+        self.assertFalse(item.is_entity())
+        item.metadata['dspace.entity.type'] = MetaDataValue('Person')
+        self.assertTrue(item.is_entity())
+        item.metadata = MetaData({})
+        self.assertFalse(item.is_entity())
 
     def test_object_type(self):
         """
@@ -37,14 +53,47 @@ class ItemTest(unittest.TestCase):
         self.item.add_content('TEST-FILE-2', '/test/path/to/file.txt', 'description',
                               bundle=Bundle('TEST'))
         self.assertEqual([Bundle('ORIGINAL'), Bundle('TEST')], self.item.get_bundles())
+        item = ds.Item('abc')
+        item.add_contents([{'content_file': 'TEST-FILE', 'path': '/test/path/to/file.txt'},
+                           {'content_file': 'TEST-FILE-2', 'path': '/test/path/to/file.txt', 'bundle': 'TEST',
+                            'description': 'description', 'permissions': [('r', 'Anonymous')]}])
+        self.assertEqual(['TEST-FILE', 'TEST-FILE-2'], [c.file_name for c in item.contents])
+        self.assertEqual([Bundle('ORIGINAL'), Bundle('TEST')], item.get_bundles())
+        self.assertEqual('description', item.contents[1].get_description())
+
+    def test_iiif_content(self):
+        """
+        Tests adding an iiif content file with several dots in its name.
+        """
+        with tempfile.TemporaryDirectory() as tmp:
+            Image.new('RGB', (20, 10)).save(os.path.join(tmp, 'my.file.name.png'))
+            item = ds.Item('abc')
+            item.add_content('my.file.name.png', tmp, 'Image', iiif=True)
+            self.assertEqual('my.file.name', item.contents[0].get_iiif_toc())
+            self.assertEqual('true', item.get_first_metadata_value('dspace.iiif.enabled'))
 
     def test_collections(self):
         """
         Tests collection related methods.
         """
         self.assertEqual(ds.Collection('abc'), self.item.get_owning_collection())
-        self.item.add_collection(ds.Collection('dfg'))
-        self.assertEqual(ds.Collection('dfg'), self.item.collections[-1])
+        item = ds.Item('xyz', collections=ds.Collection('abc'))
+        item.add_collection(ds.Collection('dfg'))
+        self.assertEqual(ds.Collection('dfg'), item.collections[-1])
+        item.add_collection(ds.Collection('hij'), primary=True)
+        self.assertEqual(ds.Collection('hij'), item.get_owning_collection())
+        self.assertEqual([ds.Collection('abc'), ds.Collection('dfg')], item.get_mapped_collections())
+
+    def test_init_collections(self):
+        """
+        Tests the different collection parameter types of the Item constructor.
+        """
+        self.assertEqual([], ds.Item('abc').collections)
+        self.assertIsNone(ds.Item('abc').get_owning_collection())
+        self.assertEqual([ds.Collection('abc')], ds.Item('abc', collections='abc').collections)
+        self.assertEqual([ds.Collection('abc')], ds.Item('abc', collections=ds.Collection('abc')).collections)
+        self.assertEqual([ds.Collection('abc'), ds.Collection('dfg')],
+                         ds.Item('abc', collections=(ds.Collection('abc'), ds.Collection('dfg'))).collections)
 
     def test_to_dict(self):
         """
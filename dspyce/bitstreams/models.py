@@ -1,26 +1,144 @@
+import asyncio
+import hashlib
 import json
 import logging
 import os
-import re
+import shutil
+import threading
 import requests
 
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dspyce.models import DSpaceObject
-from PIL import Image
+from PIL import Image, ImageFile
+
+
+_SESSION: requests.Session | None = None
+"""A shared HTTP session for reading remote bitstreams, reusing connections between requests. Created on first use."""
+
+_SESSION_LOCK = threading.Lock()
+"""A lock guarding the creation of the shared HTTP session."""
+
+_CHUNK_SIZE = 1 << 20
+"""The chunk size in bytes (1 MiB) used for streaming bitstream files."""
+
+_HTTP_PREFIXES = ('http://', 'https://')
+"""The path prefixes marking a bitstream as a remote resource."""
+
+_HEADER_CHUNK_SIZE = 1 << 16
+"""The chunk size in bytes (64 KiB) used for reading image headers."""
+
+
+def _norm_path(path: str) -> str:
+    """
+    Normalizes a local directory path to end with a slash.
+
+    :param path: The path to normalize.
+    :return: The path with a trailing slash, or the unchanged path if it is empty or already ends with one.
+    """
+    if path and not path.endswith('/'):
+        return path + '/'
+    return path
+
+
+def _copy_file(src, dst):
+    """
+    Copies the content of the binary file object src into dst. If both are real files, the data is copied inside the
+    kernel with os.copy_file_range, where available. Otherwise, it falls back to a chunk-wise copy in userspace.
+
+    :param src: The binary file object to read from.
+    :param dst: The binary file object to write to.
+    """
+    copied = 0
+    try:
+        src_fd, dst_fd = src.fileno(), dst.fileno()
+        dst.flush()
+        while n := os.copy_file_range(src_fd, dst_fd, _CHUNK_SIZE * 64):
+            copied += n
+        # Some file systems report 0 bytes copied instead of raising an error, if they don't support copy_file_range.
+        if copied == 0 and os.fstat(src_fd).st_size > 0:
+            shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+    except (AttributeError, OSError):
+        if copied > 0:
+            raise
+        shutil.copyfileobj(src, dst, _CHUNK_SIZE)
+
+
+class _HashWriter:
+    """
+    A minimal binary file-like object feeding all written data into a hashlib hash object.
+    """
+    __slots__ = ('hash',)
+
+    def __init__(self, hash_obj):
+        self.hash = hash_obj
+
+    def write(self, data: bytes) -> int:
+        """Feeds the data into the hash object and returns the number of bytes written."""
+        self.hash.update(data)
+        return len(data)
+
+
+def _read_image_size(fp) -> tuple[int, int]:
+    """
+    Reads the size of an image from its header, without decoding the pixel data or reading the rest of the file.
+
+    :param fp: The binary file object to read the image from.
+    :return: The size of the image as tuple (width, height).
+    :raises OSError: If the image format could not be identified.
+    """
+    parser = ImageFile.Parser()
+    while chunk := fp.read(_HEADER_CHUNK_SIZE):
+        parser.feed(chunk)
+        if parser.image is not None:
+            return parser.image.size
+    with parser.close() as img:
+        return img.size
+
+
+def _get_session() -> requests.Session:
+    """
+    Returns the shared HTTP session for remote bitstreams and creates it, if it doesn't exist yet.
+
+    :return: The requests.Session object.
+    """
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32,
+                                      max_retries=Retry(total=3, backoff_factor=0.2))
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _close_session():
+    """
+    Closes the shared HTTP session for remote bitstreams. A new session will be created on the next remote request.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
 
 
 class Bitstream(DSpaceObject):
     """
         A class for managing bitstream files in the DSpace context.
     """
+    __slots__ = ('file_name', 'path', 'permissions', 'bundle', 'primary', 'size_bytes', 'check_sum')
     file_name: str
     """The name of the file."""
     path: str
     """The path, where the file can be found."""
     permissions: list[dict[str, str]]
     """Permission which group shall have access to this file."""
-    show: bool
-    """If the file should be accessible for users or only provides information for the item import."""
     bundle: any
     """The bundle where to store the file. The default is set to the variable DEFAULT_BUNDLE."""
     primary: bool
@@ -45,7 +163,7 @@ class Bitstream(DSpaceObject):
         self.file_name = name
         self.path = path
         if not self.is_remote_resource():
-            self.path += '/' if len(self.path) > 0 and self.path[-1] != '/' else ''
+            self.path = _norm_path(self.path)
         self.permissions = []
         self.bundle = bundle
         self.primary = primary
@@ -81,17 +199,28 @@ class Bitstream(DSpaceObject):
 
         :return: A SAF-ready information string which can be used for the content-file.
         """
-        export_name = self.file_name
-        if self.bundle is not None:
-            export_name += f'\tbundle:{self.bundle.name}'
-        if self.get_description() is not None:
-            export_name += f'\tdescription:{self.get_description()}'
-        if len(self.permissions) > 0:
-            for p in self.permissions:
-                export_name += f'\tpermissions:-{p["type"]} \'{p["group"]}\''
+        return self._render_saf()
+
+    def _render_saf(self, bundle_entry: str = None) -> str:
+        """
+        Renders the SAF content-file line of the bitstream.
+
+        :param bundle_entry: The already rendered bundle entry ("bundle:<name>"). Can be passed by callers rendering
+            several bitstreams of the same bundle. If None, it is built from the bitstream's bundle.
+        :return: A SAF-ready information string which can be used for the content-file.
+        """
+        parts = [self.file_name]
+        if bundle_entry is not None:
+            parts.append(bundle_entry)
+        elif self.bundle is not None:
+            parts.append(f'bundle:{self.bundle.name}')
+        description = self.get_description()
+        if description is not None:
+            parts.append(f'description:{description}')
+        parts.extend(f'permissions:-{p["type"]} \'{p["group"]}\'' for p in self.permissions)
         if self.primary:
-            export_name += '\tprimary:true'
-        return export_name
+            parts.append('primary:true')
+        return '\t'.join(parts)
 
     def get_bundle_from_rest(self, rest_api):
         """
@@ -173,15 +302,28 @@ class Bitstream(DSpaceObject):
             raise ValueError(f'Permission type must be "r" or "w". Got {rw} instead!')
         self.permissions.append({'type': rw, 'group': group_name})
 
-    def get_bitstream_file(self, timeout: int = 30) -> bytes:
+    def open_bitstream(self, timeout: int = 30):
         """
-        Returns the actual file as a TextIOWrapper object.
+        Opens the bitstream file for reading. Local files are opened directly, remote files are returned as a stream of
+        the HTTP response body, so the content can be processed chunk-wise. The returned object should be closed after
+        use, e.g. by using it in a with statement.
 
         :param timeout: The connection timeout for reading bitstreams from remote resources.
+        :return: A readable binary file-like object.
         """
         if self.is_remote_resource():
-            return requests.get(self.path, timeout=timeout).content
-        with open(self.path + self.file_name, 'rb') as f:
+            response = _get_session().get(self.path, timeout=timeout, stream=True)
+            response.raw.decode_content = True
+            return response.raw
+        return open(self.full_path, 'rb')
+
+    def get_bitstream_file(self, timeout: int = 30) -> bytes:
+        """
+        Returns the content of the bitstream file as bytes.
+
+        :param timeout: The connection timeout for reading bitstreams from remote resources.
+        """
+        with self.open_bitstream(timeout) as f:
             return f.read()
 
     def save_bitstream(self, path: str, timeout: int = 30):
@@ -192,13 +334,31 @@ class Bitstream(DSpaceObject):
         :param timeout: The connection timeout for reading bitstreams from remote resources.
         :raises FileExistsError: if the file already exists in the given path.
         """
-        if self.file_name in os.listdir(path):
-            raise FileExistsError(f'The file "{self.file_name}" already exists in {path}')
-        file = self.get_bitstream_file(timeout)
-        if isinstance(file, str):
-            file = file.encode('utf-8')
-        with open(f'{path}/{self.file_name}', 'wb') as f:
-            f.write(file)
+        target = os.path.join(path, self.file_name)
+        try:
+            fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            raise FileExistsError(f'The file "{self.file_name}" already exists in {path}') from None
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                self._stream_to(f, timeout)
+        except BaseException:
+            os.remove(target)
+            raise
+
+    def _stream_to(self, fp, timeout: int = 30):
+        """
+        Writes the bitstream file chunk-wise into the given binary file object, without loading the whole file into
+        memory.
+
+        :param fp: The binary file object to write to.
+        :param timeout: The connection timeout for reading bitstreams from remote resources.
+        """
+        with self.open_bitstream(timeout) as src:
+            if self.is_remote_resource():
+                shutil.copyfileobj(src, fp, _CHUNK_SIZE)
+            else:
+                _copy_file(src, fp)
 
     def __eq__(self, other):
         """
@@ -213,6 +373,13 @@ class Bitstream(DSpaceObject):
                 self.path == other.path and
                 ((self.uuid is None or other.uuid is None) or self.uuid == other.uuid))
 
+    def __hash__(self):
+        """
+        Calculates the hash of the bitstream based on its name and path. The uuid is left out, since bitstreams without
+        uuid are equal to bitstreams with the same name and path. The hash changes if the name or path is changed.
+        """
+        return hash((self.file_name, self.path))
+
     def get_dspace_object_type(self) -> str:
         """
         Return the DSpaceObject type for the bitstream object, aka "Bitstream"
@@ -235,29 +402,61 @@ class Bitstream(DSpaceObject):
             obj_dict['bundleName'] = self.bundle.name
         return obj_dict
 
-    def set_size(self, size: int = None):
+    def compute_checksum(self, algorithm: str = 'md5', timeout: int = 30) -> str:
+        """
+        Calculates the checksum of the bitstream file chunk-wise, without loading the whole file into memory, and
+        stores it in check_sum. The checksum is calculated over the content returned by open_bitstream(), i.e. the file
+        which is saved by save_bitstream().
+
+        :param algorithm: The hash algorithm to use, any name supported by hashlib.new(). DSpace uses MD5 by default.
+        :param timeout: The connection timeout for reading bitstreams from remote resources.
+        :return: The hexadecimal checksum.
+        :raises ValueError: If the algorithm is not supported.
+        """
+        writer = _HashWriter(hashlib.new(algorithm))
+        self._stream_to(writer, timeout)
+        self.check_sum = writer.hash.hexdigest()
+        return self.check_sum
+
+    def set_size(self, size: int = None, timeout: int = 30):
         """
         Sets the size of the bitstream. If parameter size is None, this method is calculating the size of the Bitstream.
+        For remote resources not sending a Content-Length header, the size is requested with a one byte range request.
         :param size: The size of the bitstream.
+        :param timeout: The connection timeout for requesting the size of remote resources.
         """
         if size is None:
             if self.is_remote_resource():
-                headers = requests.head(self.path).headers
+                session = _get_session()
+                headers = session.head(self.path, timeout=timeout, allow_redirects=True).headers
                 if 'Content-Length' in headers:
                     self.size_bytes = int(headers['Content-Length'])
-                else:
-                    raise requests.exceptions.InvalidHeader('Did not get "Content-Length key in the header."')
+                    return
+                with session.get(self.path, headers={'Range': 'bytes=0-0'}, stream=True, timeout=timeout) as r:
+                    content_range = r.headers.get('Content-Range', '')
+                total = content_range.rpartition('/')[2]
+                if not total.isdigit():
+                    raise requests.exceptions.InvalidHeader('Did not get "Content-Length" or "Content-Range" key in '
+                                                            'the header.')
+                self.size_bytes = int(total)
             else:
-                self.size_bytes = os.path.getsize(self.path)
+                self.size_bytes = os.stat(self.full_path).st_size
         else:
             self.size_bytes = size
 
+    @property
+    def full_path(self) -> str:
+        """
+        The full local path of the bitstream file (path + file_name).
+        """
+        return self.path + self.file_name
+
     def is_remote_resource(self) -> bool:
         """
         Checks if the resources should be retrieved from an url.
         :return: True if the path starts with http(s)?://
         """
-        return re.search(r'^http(s)?://', self.path) is not None
+        return self.path.startswith(_HTTP_PREFIXES)
 
     def delete(self, rest_api):
         """
@@ -275,6 +474,9 @@ class IIIFBitstream(Bitstream):
     """
         A class for managing iiif-specific content files in the saf-packages.
     """
+    __slots__ = ('file',)
+    file: bytes | None
+    """The encoded, reduced image if add_iiif() scaled the original file down. None, if the original file is used."""
 
     def __init__(self, name: str, path: str, bundle: any = None, uuid: str = None, primary: bool = False,
                  size_bytes: int = None, check_sum: str = None):
@@ -290,22 +492,22 @@ class IIIFBitstream(Bitstream):
         :param check_sum: The checksum of the bitstream.
         """
         super().__init__(name, path, bundle, uuid, primary, size_bytes, check_sum)
+        self.file = None
 
-    def __str__(self):
+    def _render_saf(self, bundle_entry: str = None) -> str:
         """
-        Provides all information about the DSpace IIIF-Content file.
+        Renders the SAF content-file line of the bitstream including the IIIF information.
+
+        :param bundle_entry: The already rendered bundle entry ("bundle:<name>"). If None, it is built from the
+            bitstream's bundle.
         :return: A SAF-ready information string which can be used for the content-file.
         """
-        export_name = super().__str__()
-        if self.get_iiif_label() is not None:
-            export_name += f'\tiiif-label:{self.get_iiif_label()}'
-        if self.get_iiif_toc() is not None:
-            export_name += f'\tiiif-toc:{self.get_iiif_toc()}'
-        if self.get_width() is not None:
-            f'\tiiif-width:{self.get_width()}'
-        if self.get_height() is not None:
-            f'\tiiif-height:{self.get_height()}'
-        return export_name
+        parts = [super()._render_saf(bundle_entry)]
+        for key, value in (('iiif-label', self.get_iiif_label()), ('iiif-toc', self.get_iiif_toc()),
+                           ('iiif-width', self.get_width()), ('iiif-height', self.get_height())):
+            if value is not None:
+                parts.append(f'{key}:{value}')
+        return '\t'.join(parts)
 
     def add_iiif(self, label: str, toc: str, w: int = 0):
         """
@@ -313,19 +515,52 @@ class IIIFBitstream(Bitstream):
 
             :param label: is the label that will be used for the image in the viewer.
             :param toc: is the label that will be used for a table of contents entry in the viewer.
-            :param w: is the image width to reduce it. Default 0
-        """
-        img = Image.open(BytesIO(self.get_bitstream_file()))
-        width, height = img.size
-        if w != 0 and w < width:
-            scale = int(width/w)
-            super().file = img.reduce(scale).tobytes()
-        img.close()
+            :param w: is the image width to reduce it. Default 0. The stored IIIF width and height describe the
+                reduced image.
+        """
+        with super().open_bitstream() as source:
+            if w <= 0:
+                width, height = _read_image_size(source)
+            else:
+                with Image.open(source) as img:
+                    width, height = img.size
+                    if w < width:
+                        image_format = img.format
+                        # thumbnail() lets JPEG images be decoded at a reduced scale via draft().
+                        img.thumbnail((w, max(1, int(height * w / width))), Image.Resampling.LANCZOS)
+                        width, height = img.size
+                        buffer = BytesIO()
+                        img.save(buffer, format=image_format, quality=85)
+                        self.file = buffer.getvalue()
         self.add_metadata('iiif.label', label)
         self.add_metadata('iiif.toc', toc)
         self.add_metadata('iiif.image.width', str(width))
         self.add_metadata('iiif.image.height', str(height))
 
+    def set_size(self, size: int = None, timeout: int = 30):
+        """
+        Sets the size of the bitstream. If parameter size is None, the size of the reduced image created by add_iiif()
+        is used, if existing, otherwise the size of the original file. So size_bytes and check_sum describe the same
+        file.
+        :param size: The size of the bitstream.
+        :param timeout: The connection timeout for requesting the size of remote resources.
+        """
+        if size is None and self.file is not None:
+            self.size_bytes = len(self.file)
+        else:
+            super().set_size(size, timeout)
+
+    def open_bitstream(self, timeout: int = 30):
+        """
+        Opens the reduced image created by add_iiif(), if existing, otherwise the original file for reading.
+
+        :param timeout: The connection timeout for reading bitstreams from remote resources.
+        :return: A readable binary file-like object.
+        """
+        if self.file is not None:
+            return BytesIO(self.file)
+        return super().open_bitstream(timeout)
+
     def get_iiif_label(self) -> str | None:
         """
         Returns the label of the IIIF bitstream.
@@ -342,25 +577,26 @@ class IIIFBitstream(Bitstream):
         """
         Returns the size (width, height) of a given bitstream as a tuple of float values.
         """
-        if (self.get_first_metadata_value('iiif.image.width') is not None and
-            self.get_first_metadata_value('iiif.image.height') is not None):
-            return (float(self.get_first_metadata_value('iiif.image.width')),
-                    float(self.get_first_metadata_value('iiif.image.height')))
+        width = self.get_width()
+        height = self.get_height()
+        if width is not None and height is not None:
+            return float(width), float(height)
         return None
 
     def get_width(self):
         """Returns the width of a given IIIF bitstream."""
-        self.get_first_metadata_value('iiif.image.width')
+        return self.get_first_metadata_value('iiif.image.width')
 
     def get_height(self):
         """Returns the height of a given IIIF bitstream."""
-        self.get_first_metadata_value('iiif.image.height')
+        return self.get_first_metadata_value('iiif.image.height')
 
 
 class Bundle(DSpaceObject):
     """
     The class Bundle represents a bundle in the DSpace context. I can contain several bitstreams.
     """
+    __slots__ = ('bitstreams',)
 
     DEFAULT_BUNDLE: str = 'ORIGINAL'
     """The default bundle name."""
@@ -386,9 +622,9 @@ class Bundle(DSpaceObject):
             self.add_metadata('dc.description', description)
         if name != '':
             self.add_metadata('dc.title', name)
-        self.bitstreams = []
-        if bitstreams is not None:
-            [self.add_bitstream(b) for b in bitstreams]
+        self.bitstreams = [] if bitstreams is None else list(bitstreams)
+        for b in self.bitstreams:
+            b.bundle = self
 
     @staticmethod
     def get_from_rest(rest_api, uuid: str, obj_type: str='bundle', identifier: str = None):
@@ -412,9 +648,10 @@ class Bundle(DSpaceObject):
         return bundle
 
     def __str__(self):
+        bundle_entry = f'bundle:{self.name}'
         return ('Bundle - {}{}:\n{}'.format(self.name,
                                             f'({self.uuid})' if self.uuid is not None else '',
-                                            '\n'.join([f'\t{i}' for i in self.bitstreams])))
+                                            '\n'.join('\t' + b._render_saf(bundle_entry) for b in self.bitstreams)))
 
     def __eq__(self, other) -> bool:
         """
@@ -430,14 +667,16 @@ class Bundle(DSpaceObject):
 
         return self.uuid == other.uuid and self.name == other.name
 
-    def get_bitstreams(self, filter_condition=lambda x: True) -> list[Bitstream]:
+    def get_bitstreams(self, filter_condition=None) -> list[Bitstream]:
         """
         Returns a list of bitstreams in this bundle, filtered by a filter defined in filter_condition.
 
-        :param filter_condition: A condition to filter the bitstreams returned.
+        :param filter_condition: A condition to filter the bitstreams returned. If None, all bitstreams are returned.
         :return: A list of Bitstream objects.
         """
-        return list(filter(filter_condition, self.bitstreams))
+        if filter_condition is None:
+            return self.bitstreams.copy()
+        return [b for b in self.bitstreams if filter_condition(b)]
 
     def get_bitstreams_from_rest(self, rest_api):
         """
@@ -498,15 +737,64 @@ class Bundle(DSpaceObject):
         """
         self.bitstreams.remove(bitstream)
 
-    def save_bitstreams(self, path: str):
+    def save_bitstreams(self, path: str, max_workers: int = None):
         """
-        Saves the bitstreams of the given bundle into path.
+        Saves the bitstreams of the given bundle into path. The bitstreams are saved concurrently in a thread pool.
 
         :param path: The path where to save the bitstreams.
+        :param max_workers: The maximum number of bitstreams saved at the same time. Defaults to twice the number of
+            CPUs, but not more than 16.
         :raises FileExistsError: If the Bitstream already exists in the given path.
         """
-        for b in self.bitstreams:
-            b.save_bitstream(path)
+        if not self.bitstreams:
+            return
+        if max_workers is None:
+            max_workers = min(16, (os.cpu_count() or 1) * 2)
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(self.bitstreams))) as executor:
+            futures = [executor.submit(b.save_bitstream, path) for b in self.bitstreams]
+            try:
+                for future in as_completed(futures):
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    async def save_bitstreams_async(self, path: str, concurrency: int = 16):
+        """
+        Saves the bitstreams of the given bundle into path, awaitable from an asyncio event loop. The bitstreams are
+        saved in a dedicated thread pool, so the event loop is not blocked while the files are transferred. Like
+        save_bitstreams(), the first failure cancels the bitstreams not started yet and is raised after the running
+        saves have finished.
+
+        :param path: The path where to save the bitstreams.
+        :param concurrency: The maximum number of bitstreams saved at the same time.
+        :raises FileExistsError: If the Bitstream already exists in the given path.
+        """
+        if not self.bitstreams:
+            return
+        executor = ThreadPoolExecutor(max_workers=min(concurrency, len(self.bitstreams)))
+        futures = [executor.submit(b.save_bitstream, path) for b in self.bitstreams]
+        try:
+            done, _ = await asyncio.wait([asyncio.wrap_future(f) for f in futures],
+                                         return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            for future in futures:
+                future.cancel()
+            # Running saves can not be cancelled, so wait for them before returning or raising.
+            await asyncio.wait([asyncio.wrap_future(f) for f in futures])
+            executor.shutdown()
+        for future in done:
+            if future.exception() is not None:
+                raise future.exception()
+
+    @staticmethod
+    def close():
+        """
+        Closes the HTTP connections kept open for reading remote bitstreams. They are shared by all bundles and will be
+        reopened when needed.
+        """
+        _close_session()
 
     def get_description(self) -> str:
         """
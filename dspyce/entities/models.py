@@ -81,7 +81,7 @@ class Relation:
             logging.info('No relation type specified, trying to find relation-type via the rest endpoint.')
             left_item_type = self.items[0].get_entity_type()
             rels = Relation.get_by_type_from_rest(rest_api, left_item_type)
-            rels = list(filter(lambda x: x.relation_key == self.relation_key, rels))
+            rels = [r for r in rels if r.relation_key == self.relation_key]
             if len(rels) != 1:
                 if len(rels) > 1:
                     logging.critical('Something went wrong with on the rest-endpoint: found more than one relation with'
@@ -264,7 +264,7 @@ def from_rest_api(url: str) -> EntityModell:
     from dspyce.rest import RestAPI
     rest = RestAPI(url)
     entity_objects = rest.get_paginated_objects('core/entitytypes', 'entitytypes')
-    entity_objects = list(filter(lambda x: x['label'] != 'none', entity_objects))
+    entity_objects = [e for e in entity_objects if e['label'] != 'none']
     if len(entity_objects) == 0:
         raise ValueError(f'No entity types found in instance "{url}"')
     em = EntityModell()
@@ -290,4 +290,4 @@ def check_entities_rest(url: str) -> bool:
     """
     from dspyce.rest import RestAPI
     entity_objects = RestAPI(url).get_paginated_objects('core/entitytypes', 'entitytypes')
-    return len(list(filter(lambda x: x['label'] != 'none', entity_objects))) > 0
+    return any(e['label'] != 'none' for e in entity_objects)
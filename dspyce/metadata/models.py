@@ -107,7 +107,7 @@ class MetaData(dict):
                     raise TypeError(f'All values must be of type MetaDataValue, but found {type(value)}')
             super().__setitem__(key, value)
         else:
-            if key not in self.keys():
+            if key not in self:
                 super().__setitem__(key, [value])
             else:
                 self.__getitem__(key).append(value)
@@ -142,13 +142,13 @@ class MetaData(dict):
         """
         if schema not in self.get_schemas():
             raise KeyError(f'The schema "{schema}" is not used.')
-        return MetaData({k: self.__getitem__(k) for k in filter(lambda x: x.split('.')[0] == schema, self.keys())})
+        return MetaData({k: self.__getitem__(k) for k in self.keys() if k.split('.')[0] == schema})
 
     def to_dict(self):
         """
         Returns the metadata including all values as a rest-compatible dictionary.
         """
-        return {k: list(map(lambda x: dict(x), self.get(k))) for k in self.keys()}
+        return {k: [dict(v) for v in values] for k, values in self.items()}
 
 
 class MetadataSchema:
@@ -1,4 +1,5 @@
 import logging
+import os
 from json import JSONDecodeError
 
 import requests
@@ -12,6 +13,7 @@ class DSpaceObject:
     The class DSpaceObject represents an Object in a DSpace repository, such as Items, Collections, Communities.
     """
     """The MetaData and MetaDataValue classes used."""
+    __slots__ = ('uuid', 'handle', 'name', 'metadata', 'statistic_reports', '_metadata_updates', '_track_updates')
 
     uuid: str
     """The uuid of the DSpaceObject"""
@@ -25,9 +27,9 @@ class DSpaceObject:
     """A dictionary of statistic report objects."""
     TYPES: tuple[str] = ('item', 'community', 'collection', 'bundle', 'bitstream')
     """A constant given information of all existing DSpaceObject types."""
-    _metadata_updates: list[dict] = []
+    _metadata_updates: list[dict]
     """A private variable storing metadata update operations"""
-    _track_updates: bool = False
+    _track_updates: bool
     """A boolean value giving information about whether to track updates, to the current DSpace Object."""
 
     def __init__(self, uuid: str = '', handle: str = '', name: str = ''):
@@ -43,6 +45,8 @@ class DSpaceObject:
         self.name = name
         self.metadata = MetaData({})
         self.statistic_reports = {}
+        self._metadata_updates = []
+        self._track_updates = False
 
     def _store_metadata_update(self, operation: str, data: any, position = None):
         """
@@ -192,40 +196,45 @@ class DSpaceObject:
         if self._track_updates:
             self._store_metadata_update('add', {tag: [dict(value)]}, True)
 
-    def remove_metadata(self, tag: str, value: str = None, index: int = None):
+    def remove_metadata(self, tag: str, value: str | set[str] = None, index: int = None):
         """
         Remove a specific metadata field from the DSpaceObject. Can either be all values for a field or ony a specific
-        value based on the *value* parameter, or the specific value identified by its position (index).
+        value based on the *value* parameter, or the specific value identified by its position (index). If the tag,
+        value or index doesn't exist, nothing will be removed.
 
         :param tag: The correct metadata tag. The string must use the format <schema>.<element>.<qualifier>.
         :param value: The value of the metadata field to delete. Can be used, if only one value in a list of values
-            should be deleted. If None, all values from the given tag will be deleted.
+            should be deleted. A set of values deletes all of them in one pass. If None, all values from the given tag
+            will be deleted.
         :param index: The index of the metadata value to delete. Either value or index must be None.
         :raises AttributeError: If index and value parameter are provided. Only one of those can be used.
         """
         if value is not None and index is not None:
             raise AttributeError('You can not use both parameters value and index for removing metadata.')
-        elif value is None and index is None:
-            self.metadata.pop(tag)
+        if value is None and index is None:
+            if self.metadata.pop(tag, None) is None:
+                return
             if self._track_updates:
                 self._store_metadata_update('delete', tag, -1)
         elif index is None:
-            try:
-                position = [i.value for i in self.metadata[tag]].index(value)
-            except ValueError:
+            values = value if isinstance(value, (set, frozenset)) else {value}
+            md = self.get_metadata(tag)
+            retained = [v for v in md if v.value not in values]
+            if len(retained) == len(md):
                 return
-            while position is not None:
-                self.metadata[tag].pop(position)
-                if self._track_updates:
-                    self._store_metadata_update('delete', tag, position)
-                try:
-                    position = [i.value for i in self.metadata[tag]].index(value)
-                except ValueError:
-                    return
+            if self._track_updates:
+                # Positions are stored as they would appear after each preceding deletion.
+                removed = 0
+                for position, v in enumerate(md):
+                    if v.value in values:
+                        self._store_metadata_update('delete', tag, position - removed)
+                        removed += 1
+            md[:] = retained
         elif index is not None:
-            if index > len(self.get_metadata(tag)):
+            md = self.get_metadata(tag)
+            if index >= len(md):
                 return
-            self.metadata[tag].pop(index)
+            md.pop(index)
             if self._track_updates:
                 self._store_metadata_update('delete', tag, index)
 
@@ -256,9 +265,7 @@ class DSpaceObject:
                            'exist')
         if to_position >= len(md) or to_position <= (len(md)*-1):
             raise IndexError('The target position of the MetadataValue to move is out of range for the metadata list.')
-        value = md.pop(from_position)
-        md = md[:to_position] + [value] + md[to_position:]
-        self.metadata[tag] = md
+        md.insert(to_position, md.pop(from_position))
         if self._track_updates:
             self._store_metadata_update('move', tag, (from_position, to_position))
 
@@ -326,9 +333,25 @@ class DSpaceObject:
         return None
 
     def __eq__(self, other):
-        if self.uuid == '' and other.uuid == '' and self.handle == '' and other.handle == '':
+        uuid = self.uuid
+        if uuid != '':
+            return uuid == other.uuid
+        handle = self.handle
+        if handle == '' and other.uuid == '' and other.handle == '':
             raise ValueError('Can not compare objects without a uuid or handle.')
-        return (self.uuid == other.uuid) if self.uuid != '' else (self.handle == other.handle)
+        return handle == other.handle
+
+    def __hash__(self):
+        """
+        Hashes the object by its uuid or, if no uuid exists, by its handle. Objects should not change their identifier
+        while being stored in a set or used as dictionary keys.
+
+        Note: __eq__ compares by the handle if the left object has no uuid. An object known only by its handle (e.g.
+        read from a SAF package) is therefore equal to the same object with uuid and handle (e.g. loaded from the REST
+        API), but both have different hashes. Such objects are not found in sets or dictionaries containing the other
+        one. Compare them with == in this case.
+        """
+        return hash(self.uuid or self.handle)
 
     def __str__(self):
         return f'DSpace object with the uuid {self.uuid}:\n\t' + '\n\t'.join(str(self.metadata).split('\n'))
@@ -337,25 +360,21 @@ class DSpaceObject:
         """
             Converts the current item object to a dictionary object containing all available metadata.
         """
-        obj_dict = {}
-        if self.uuid != '':
-            obj_dict['uuid'] = self.uuid
-        if self.handle != '':
-            obj_dict['handle'] = self.handle
-        if self.name != '':
-            obj_dict['name'] = self.name
-        if self.get_dspace_object_type() is not None:
-            obj_dict['type'] = self.get_dspace_object_type().lower()
+        obj_dict = {k: v for k, v in (('uuid', self.uuid), ('handle', self.handle), ('name', self.name)) if v != ''}
+        obj_type = self.get_dspace_object_type()
+        if obj_type is not None:
+            obj_dict['type'] = obj_type.lower()
         obj_dict['metadata'] = self.metadata.to_dict()
         return obj_dict
 
     def has_metadata(self, tag: str) -> bool:
         """
-        Checks whether this object has a specific metadata field.
+        Checks whether this object has a specific metadata field. The check is a single hash lookup in the metadata
+        dictionary, so it can be used for repeated probes without caching.
         :param tag: The metadata tag to check.
         :returns: True if the metadata field exists, False otherwise.
         """
-        return tag in self.metadata.keys()
+        return tag in self.metadata
 
     def get_metadata(self, tag: str) -> list[MetaDataValue]:
         """
@@ -376,6 +395,17 @@ class DSpaceObject:
         m = self.get_metadata(tag)
         return [v.value for v in m] if len(m) > 0 else None
 
+    def iter_metadata_values(self, tag: str):
+        """
+        Iterates over the metadata values of a specific tag without creating a new list. Useful for membership checks
+        or loops over large metadata fields, e.g. relation.*.
+
+        :param tag: The metadata tag: prefix.element.qualifier
+        :return: A generator yielding the values. Yields nothing, if the tag doesn't exist.
+        """
+        for v in self.get_metadata(tag):
+            yield v.value
+
     def get_first_metadata(self, tag: str) -> MetaDataValue | None:
         """
         Retrieve the first metadata value of a specific metadata field.
@@ -387,7 +417,8 @@ class DSpaceObject:
         """
         Retrieve the first metadata value of a specific metadata field.
         """
-        return self.get_metadata_values(tag)[0] if self.get_metadata_values(tag) is not None else None
+        md = self.get_metadata(tag)
+        return md[0].value if len(md) > 0 else None
 
     def add_statistic_report(self, report: dict | list[dict] | None):
         """
@@ -397,18 +428,15 @@ class DSpaceObject:
         """
         if report is None:
             return
-        report = [report] if isinstance(report, dict) else report
-        for r in report:
-            for k in r.keys():
-                if k not in self.statistic_reports.keys():
-                    self.statistic_reports[k] = r[k]
+        reports = [report] if isinstance(report, dict) else report
+        statistic_reports = self.statistic_reports
+        for r in reports:
+            for k, v in r.items():
+                if k in statistic_reports and isinstance(v, dict):
+                    existing = statistic_reports[k]
+                    statistic_reports[k] = existing + [v] if isinstance(existing, list) else [existing, v]
                 else:
-                    if isinstance(r[k], dict):
-                        self.statistic_reports[k] = (self.statistic_reports[k] +
-                                                     [r[k]]) if isinstance(self.statistic_reports[k],
-                                                                           list) else [self.statistic_reports[k], r[k]]
-                    else:
-                        self.statistic_reports[k] = r[k]
+                    statistic_reports[k] = v
 
     def has_statistics(self) -> bool:
         """
@@ -416,13 +444,14 @@ class DSpaceObject:
 
         :return: True if there is at least one report.
         """
-        return len(self.statistic_reports.keys()) > 0
+        return bool(self.statistic_reports)
 
 
 class Community(DSpaceObject):
     """
     The class Community represents a DSpace community containing sub communities or collections.
     """
+    __slots__ = ('parent_community', 'sub_communities', 'sub_collections')
     parent_community: DSpaceObject | None
     sub_communities: list[DSpaceObject]
     sub_collections: list[DSpaceObject]
@@ -553,6 +582,7 @@ class Collection(DSpaceObject):
     """
     The class Collection represents a DSpace collection, containing different Items and having a parent community.
     """
+    __slots__ = ('community',)
     community: Community
 
     def __init__(self, uuid: str = '', handle: str = '', name: str = '', community: Community = None, ):
@@ -646,6 +676,7 @@ class Item(DSpaceObject):
     The class Item represents a single DSpace item. It can have a owning collection, several Bitstreams or relations
     to other items, if it's an entity.
     """
+    __slots__ = ('collections', 'relations', 'contents', 'bundles', 'in_archive', 'discoverable', 'withdrawn')
     from dspyce.bitstreams.models import Bitstream, Bundle, IIIFBitstream
     """Bitstream, Bundle and IIIF for Item objects"""
     from dspyce.entities.models import Relation
@@ -658,11 +689,11 @@ class Item(DSpaceObject):
     """The list of bitstreams for this item."""
     bundles: list[Bundle]
     """The list of bundles for this item."""
-    in_archive: bool = True
+    in_archive: bool
     """Whether an item is archived in DSpace."""
-    discoverable: bool = True
+    discoverable: bool
     """Whether an item is discoverable in DSpace."""
-    withdrawn: bool = False
+    withdrawn: bool
     """Whether an item is withdrawn from DSpace."""
 
     def __init__(self, uuid: str = '', handle: str = '', name: str = '',
@@ -677,17 +708,22 @@ class Item(DSpaceObject):
         collection. Just an uuid can also be provided.
         """
         super().__init__(uuid, handle, name)
-        if isinstance(collections, str):
-            self.collections = [Collection(uuid=collections, community=None)]
+        if collections is None:
+            self.collections = []
+        elif isinstance(collections, list):
+            self.collections = collections
         elif isinstance(collections, Collection):
             self.collections = [collections]
-        elif collections is None:
-            self.collections = []
+        elif isinstance(collections, str):
+            self.collections = [Collection(uuid=collections, community=None)]
         else:
-            self.collections = collections
+            self.collections = list(collections)
         self.relations = []
         self.contents = []
         self.bundles = []
+        self.in_archive = True
+        self.discoverable = True
+        self.withdrawn = False
 
     @staticmethod
     def get_from_rest(rest_api, uuid: str, obj_type: str='item', identifier: str = None):
@@ -743,8 +779,8 @@ class Item(DSpaceObject):
         owning_collection = json_to_object(get_result)
         mapped_collections = rest_api.get_paginated_objects(f'core/items/{self.uuid}/mappedCollections',
                                                         'mappedCollections')
-        self.collections = [owning_collection] + list(filter(lambda x: x is not None,
-                                                             [json_to_object(m) for m in mapped_collections]))
+        mapped_collections = [json_to_object(m) for m in mapped_collections]
+        self.collections = [owning_collection] + [c for c in mapped_collections if c is not None]
 
     def get_relations_from_rest(self, rest_api):
         """
@@ -864,7 +900,7 @@ class Item(DSpaceObject):
 
         :return: True, if the Item is an entity.
         """
-        return self.metadata.get('dspace.entity.type') is not None
+        return self.has_metadata('dspace.entity.type')
 
     def get_entity_type(self) -> str | None:
         """
@@ -874,7 +910,7 @@ class Item(DSpaceObject):
         :return: The entity type as a string, if existing, else None.
         """
         if self.is_entity():
-            return self.get_metadata_values('dspace.entity.type')[0]
+            return self.get_first_metadata_value('dspace.entity.type')
 
         return None
 
@@ -886,7 +922,7 @@ class Item(DSpaceObject):
         :return:
         """
         if primary:
-            self.collections = [c] + self.collections
+            self.collections.insert(0, c)
         else:
             self.collections.append(c)
 
@@ -918,6 +954,27 @@ class Item(DSpaceObject):
         :param width: The width of an image. Only needed, if the file is a jpg, wich should be reduced and iiif is True.
         :param iiif_toc: A toc information for an iiif-specific bitstream.
         """
+        self.contents.append(self._create_content(content_file, path, description, bundle, permissions, iiif, width,
+                                                  iiif_toc))
+
+    def add_contents(self, contents: list[dict]):
+        """
+        Adds several content-files to the item at once.
+
+        :param contents: A list of dictionaries containing the parameters of add_content() for each content file, e.g.
+            [{'content_file': 'image.jpg', 'path': '/path/to/files', 'iiif': True}, ...]
+        """
+        self.contents.extend(self._create_content(**c) for c in contents)
+
+    def _create_content(self, content_file: str, path: str, description: str = '', bundle = None,
+                        permissions: list[tuple[str, str]] = None, iiif: bool = False, width: int = 0,
+                        iiif_toc: str = ''):
+        """
+        Creates a new Bitstream (or IIIFBitstream) and adds it to the matching bundle of the item. See add_content()
+        for the parameters.
+
+        :return: The created Bitstream.
+        """
         if bundle is None:
             bundle = self.Bundle(self.Bundle.DEFAULT_BUNDLE, '', '', [])
         active_bundle = self.get_bundle(
@@ -929,9 +986,9 @@ class Item(DSpaceObject):
 
         if iiif:
             cf = self.IIIFBitstream(content_file, path, bundle=bundle)
-            name = content_file.split('.')[0]
+            name = os.path.splitext(content_file)[0]
             cf.add_iiif(description, name if iiif_toc == '' else iiif_toc, w=width)
-            if self.metadata.get('dspace.iiif.enabled') is None:
+            if not self.has_metadata('dspace.iiif.enabled'):
                 self.add_metadata('dspace.iiif.enabled', 'true', 'en')
         else:
             cf = self.Bitstream(content_file, path, bundle=bundle)
@@ -939,10 +996,10 @@ class Item(DSpaceObject):
         if description != '':
             cf.add_description(description)
         if permissions is not None:
-            for p in permissions:
-                cf.add_permission(p[0], p[1])
-        self.contents.append(cf)
+            for permission_type, group_name in permissions:
+                cf.add_permission(permission_type, group_name)
         active_bundle.add_bitstream(cf)
+        return cf
 
     def move_item(self, rest, new_collection: Collection = None):
         """
@@ -970,7 +1027,7 @@ class Item(DSpaceObject):
             collection_uuid = collection.uuid
             logging.debug('Remove mapped collection (%s) from item (%s).' % (collection_uuid, self.uuid))
             rest.delete_api(f'core/items/{self.uuid}/mappedCollections/{collection_uuid}')
-            self.collections = list(filter(lambda x: x != collection, self.collections))
+            self.collections = [c for c in self.collections if c != collection]
         else:
             for c in self.get_mapped_collections():
                 logging.debug('Remove mapped collection (%s) from item (%s).' % (c.uuid, self.uuid))
@@ -1008,7 +1065,7 @@ class Item(DSpaceObject):
 
         :return: The collection object of the owning collection or None.
         """
-        return None if self.collections is None else self.collections[0]
+        return self.collections[0] if len(self.collections) > 0 else None
 
     def get_mapped_collections(self) -> list[Collection]:
         """
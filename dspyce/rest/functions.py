@@ -60,7 +60,7 @@ def json_to_object(json_content: dict):
         case 'item':
             obj = Item(uuid, handle=handle, name=name)
             if 'inArchive' in json_content.keys():
-                obj.inArchive = str(json_content['inArchive']).lower() == 'true'
+                obj.in_archive = str(json_content['inArchive']).lower() == 'true'
             if 'discoverable' in json_content.keys():
                 obj.discoverable = str(json_content['discoverable']).lower() == 'true'
             if 'withdrawn' in json_content.keys():
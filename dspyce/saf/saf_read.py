@@ -26,7 +26,7 @@ def read_saf_package(path: str) -> Item:
     """
     path = path[:-1] if path.endswith('/') else path
     files = os.listdir(path)
-    metadata_files = filter(lambda x: re.search(r'((metadata_[a-zA-Z\-]+)|(dublin_core))\.xml$', x), files)
+    metadata_files = [f for f in files if re.search(r'((metadata_[a-zA-Z\-]+)|(dublin_core))\.xml$', f)]
     further_information: dict[str: list] = {'contents': [], 'collections': [], 'relationships': []}
     handle = ''
     for file_name in ('contents', 'collections', 'relationships'):
@@ -58,10 +58,10 @@ def read_saf_package(path: str) -> Item:
         except ValueError:
             item.add_collection(Collection(handle=c))
 
-    for r in filter(lambda x: x.strip() != '', further_information['relationships']):
+    for r in (x for x in further_information['relationships'] if x.strip() != ''):
         relation = r.split(' ')
         item.add_relation(relation[0].replace('relation.', ''), relation[1])
-    for b in filter(lambda x: x.strip() != '', further_information['contents']):
+    for b in (x for x in further_information['contents'] if x.strip() != ''):
         bitstream = b.split('\t')
         name = bitstream[0]
         try:
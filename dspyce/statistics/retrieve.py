@@ -86,16 +86,14 @@ def all_statistics_to_object(obj: str | DSpaceObject, rest_api: RestAPI) -> list
     :raise TypeError: If type(object) is not DSpaceObject
     """
     if isinstance(obj, DSpaceObject):
-        stats = list(filter(lambda x: x is not None,
-                            [download_statistics_to_object(obj.uuid,
-                                                           report_type, rest_api) for report_type in REPORT_TYPES]))
+        stats = [s for s in (download_statistics_to_object(obj.uuid, report_type, rest_api)
+                             for report_type in REPORT_TYPES) if s is not None]
         obj.add_statistic_report(stats)
         del stats
         return obj
     if isinstance(obj, str):
-        return list(filter(lambda x: x is not None,
-                           [download_statistics_to_object(obj,
-                                                          report_type, rest_api) for report_type in REPORT_TYPES]))
+        return [s for s in (download_statistics_to_object(obj, report_type, rest_api)
+                            for report_type in REPORT_TYPES) if s is not None]
 
     raise TypeError(f"The obj type must be either DSpaceObject or str, but got {type(obj)}!")
 